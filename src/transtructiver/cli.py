@@ -21,10 +21,12 @@ import argparse
 import importlib
 import inspect
 import json
+import logging
 import os
 import pkgutil
 import re
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from .data_loading.data_loader import DataLoader
 from .parsing.parser import Parser
 from .config import load_config, resolve_enabled_rules, get_rule_params
@@ -114,13 +116,13 @@ _RULE_PARAM_PROPAGATIONS = {
 }
 
 ####################################################################
-# Dataclasses and prototype helpers
+# Dataclasses and debug logging helpers
 ####################################################################
 
-# PROTOTYPE-ONLY OUTPUT:
-# Keep developer-facing logs enabled in prototype runs.
-# For production hardening, set this to False (or remove related helpers/calls).
-PROTOTYPE_OUTPUT_ENABLED = False
+# Developer-facing per-row output is routed through the logging module so
+# non-debug runs skip both the formatting work and the stdout writes.
+# Enable it with --verbose (sets the level to DEBUG).
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -141,28 +143,30 @@ class PipelineOptions:
     resume: bool = False
     max_rows_per_shard: int = 0
     compress_output: bool = False
+    workers: int = 1
 
 
 def _prototype_log(message: str) -> None:
-    """PROTOTYPE-ONLY: central log sink for easy production removal.
+    """Central debug log sink for per-row pipeline chatter.
 
     Args:
-        message (str): The log message to print.
+        message (str): The log message to emit at DEBUG level.
     """
-    if PROTOTYPE_OUTPUT_ENABLED:
-        print(message)
+    logger.debug(message)
 
 
 def _prototype_pretty(label: str, root: Node) -> None:
-    """PROTOTYPE-ONLY: pretty-print a CST for debugging and demos.
+    """Log the reconstructed code of a CST for debugging and demos.
+
+    Code reconstruction walks the whole tree, so it is skipped entirely
+    unless DEBUG logging is enabled.
 
     Args:
-        label (str): Label to print before the CST.
-        root (Node): CST root node to pretty-print.
+        label (str): Label to log before the code.
+        root (Node): CST root node to render.
     """
-    if PROTOTYPE_OUTPUT_ENABLED:
-        print(label)
-        print(root.to_code())
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s\n%s", label, root.to_code())
 
 
 ####################################################################
@@ -240,6 +244,130 @@ def _build_engine(
     return MutationEngine(configured_rules)
 
 
+####################################################################
+# Per-snippet processing (shared by serial and multi-process modes)
+####################################################################
+
+
+@dataclass
+class SnippetResult:
+    """Outcome of processing a single snippet, consumed by the main process.
+
+    Carries everything the output writers need so the parse/mutate/verify
+    work can run in worker processes while all file writes stay on the
+    main process.
+    """
+
+    idx: int
+    snippet_id: str
+    status: str  # "ok", "parse_skipped", or "missing_fields"
+    parse_reason: str | None = None
+    manifest_entries: list[dict] = field(default_factory=list)
+    original_code: str | None = None
+    mutated_code: str | None = None
+    language: str | None = None
+    metadata: dict = field(default_factory=dict)
+    original_cst_json: str | None = None
+    has_mutation_applied: bool = False
+    verified: bool = False
+    errors: list[str] = field(default_factory=list)
+
+
+# Per-process pipeline components, built once by _init_worker. Using a module
+# dict keeps _process_snippet picklable for ProcessPoolExecutor.
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(
+    rules: list[str], rule_params: dict[str, dict] | None, log_level: int = logging.INFO
+) -> None:
+    """Build the parser/engine/verifier used by _process_snippet.
+
+    Runs once per worker process (as the pool initializer), or once on the
+    main process when the pipeline runs serially. Worker processes start
+    with an unconfigured root logger, so the main process's resolved log
+    level is applied here; without it --verbose output from the per-row
+    debug calls would be dropped whenever workers > 1.
+
+    Args:
+        rules (list[str]): Validated mutation rule names.
+        rule_params (dict[str, dict] | None): Per-rule parameters.
+        log_level (int): Root logger level resolved by the main process.
+    """
+    logging.basicConfig(level=log_level, format="%(message)s")
+    _WORKER_STATE["parser"] = Parser()
+    _WORKER_STATE["engine"] = _build_engine(rules, rule_params)
+    _WORKER_STATE["verifier"] = SIVerifier()
+
+
+def _process_snippet(item: tuple[int, dict]) -> SnippetResult:
+    """Parse, mutate, and verify a single snippet.
+
+    Top-level and driven only by the (index, row) tuple plus _WORKER_STATE,
+    so it can be dispatched through a process pool.
+
+    Args:
+        item (tuple[int, dict]): Global row index and the raw dataset row.
+
+    Returns:
+        SnippetResult: Everything needed to write outputs for this snippet.
+    """
+    idx, row = item
+    parser = _WORKER_STATE["parser"]
+    engine = _WORKER_STATE["engine"]
+    verifier = _WORKER_STATE["verifier"]
+
+    snippet_id = f"row_{idx}"
+    code = row.get("code") or row.get("mutated_code")
+    language = row.get("language")
+
+    _prototype_log(f"\n[{snippet_id}] Parsing...")
+    if not code or not language:
+        return SnippetResult(idx, snippet_id, status="missing_fields")
+
+    start_cst, parse_err = parser.parse(code, language)
+
+    if start_cst is None:
+        _prototype_log(f"  Skipped ({parse_err})")
+        return SnippetResult(idx, snippet_id, status="parse_skipped", parse_reason=parse_err)
+
+    _prototype_pretty("Original tree:", start_cst)
+
+    # Clone before mutation so we keep the clean original for comparison
+    mut_cst = start_cst.clone()
+    engine.apply_mutations(mut_cst)
+
+    _prototype_pretty("\nMutated code:", mut_cst)
+
+    cached_original_cst = row.get("original_cst")
+    if cached_original_cst:
+        orig_cst = Node.from_json(cached_original_cst)
+    else:
+        orig_cst = start_cst
+
+    # Keep all other metadata fields from the original row, except code/language which we handle separately
+    metadata = dict(row)
+    metadata.pop("code", None)
+    metadata.pop("language", None)
+
+    verified = verifier.verify(orig_cst, mut_cst, engine.manifest)
+
+    return SnippetResult(
+        idx,
+        snippet_id,
+        status="ok",
+        manifest_entries=engine.manifest.to_dict(),
+        original_code=start_cst.to_code(),
+        mutated_code=mut_cst.to_code(),
+        language=language,
+        metadata=metadata,
+        original_cst_json=orig_cst.to_json() if hasattr(orig_cst, "to_json") else None,
+        has_mutation_applied=not engine.manifest.is_empty(),
+        verified=verified,
+        errors=list(verifier.errors),
+    )
+
+
 ####################################################################
 # Pipeline execution
 ####################################################################
@@ -276,134 +404,122 @@ def run_pipeline(
     Raises:
         ValueError: If any rule name is not registered in RULE_REGISTRY.
     """
+    # Fail fast on unknown rules before touching the filesystem or dataset.
+    unsupported_rules = _validate_rules(rules)
+    if unsupported_rules:
+        raise ValueError(f"Arguments contain unsupported mutation rule: {unsupported_rules}")
+
     os.makedirs(output_dir, exist_ok=True)
     pipeline_options = pipeline_options or PipelineOptions()
     # Use DataLoader abstraction; implementation is chosen internally.
     loader = DataLoader(filepath, checkpoint_path=pipeline_options.checkpoint_path)
     start_index = loader.load_checkpoint(pipeline_options.resume)
 
-    parser = Parser()
-
-    unsupported_rules = _validate_rules(rules)
-    if unsupported_rules:
-        raise ValueError(f"Arguments contain unsupported mutation rule: {unsupported_rules}")
-
-    engine = _build_engine(rules, rule_params)
-    verifier = SIVerifier()
     stats = RunStats()
     processed_since_checkpoint = 0
 
-    with OutputManager(
-        output_dir,
-        max_rows_per_shard=pipeline_options.max_rows_per_shard,
-        compress_output=pipeline_options.compress_output,
-    ) as outputs:
-        index = 0
-
-        for idx, row in tqdm(
-            loader.iter_snippets(
-                batch_size=pipeline_options.batch_size,
-                start_index=start_index,
-            ),
-            total=loader.num_rows,
-        ):
-            index = idx
-            snippet_id = f"row_{idx}"
-            code = row.get("code") or row.get("mutated_code")
-            language = row.get("language")
-
-            _prototype_log(f"\n[{snippet_id}] Parsing...")
-            if not code or not language:
-                continue
+    snippets = loader.iter_snippets(
+        batch_size=pipeline_options.batch_size,
+        start_index=start_index,
+    )
 
-            start_cst, parse_err = parser.parse(code, language)
+    # Parse/mutate/verify is embarrassingly parallel per snippet; with
+    # workers > 1 it is fanned out over a process pool while all output
+    # writes and checkpointing stay ordered on the main process.
+    # buffersize caps how far map() reads ahead of the consumers, so the
+    # snippet iterator stays a bounded stream instead of being drained
+    # (and pickled) into the pending-work queue all at once.
+    executor: ProcessPoolExecutor | None = None
+    log_level = logging.getLogger().getEffectiveLevel()
+    if pipeline_options.workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=pipeline_options.workers,
+            initializer=_init_worker,
+            initargs=(rules, rule_params, log_level),
+        )
+        results = executor.map(
+            _process_snippet,
+            snippets,
+            chunksize=16,
+            buffersize=pipeline_options.workers * 16,
+        )
+    else:
+        _init_worker(rules, rule_params, log_level)
+        results = map(_process_snippet, snippets)
+
+    try:
+        with OutputManager(
+            output_dir,
+            max_rows_per_shard=pipeline_options.max_rows_per_shard,
+            compress_output=pipeline_options.compress_output,
+        ) as outputs:
+            index = 0
+
+            for result in tqdm(results, total=loader.num_rows):
+                index = result.idx
+
+                if result.status == "missing_fields":
+                    continue
+
+                if result.status == "parse_skipped":
+                    stats.parse_skipped += 1
+                else:
+                    stats.parsed_ok += 1
+
+                    # Write manifest for this snippet
+                    outputs.write_manifest(result.idx, result.snippet_id, result.manifest_entries)
+
+                    # Write original/mutated code pair
+                    outputs.write_dataset_row(
+                        result.idx,
+                        result.snippet_id,
+                        result.original_code,
+                        result.mutated_code,
+                        result.language,
+                        has_mutation_applied=result.has_mutation_applied,
+                        metadata=result.metadata,
+                        original_cst=result.original_cst_json,
+                    )
+
+                    # Append semantic preservation verdict to summary log
+                    if result.verified:
+                        stats.verified_ok += 1
+                    else:
+                        stats.verified_fail += 1
+
+                    summary_logger.write_summary(
+                        snippet_id=result.snippet_id,
+                        verified=result.verified,
+                        errors=result.errors,
+                        writer=outputs.summary_writer,
+                    )
+
+                    _prototype_log(f'\nRow {result.idx}: {"PASS" if result.verified else "FAIL"}')
 
-            if start_cst is None:
-                stats.parse_skipped += 1
-                _prototype_log(f"  Skipped ({parse_err})")
                 processed_since_checkpoint += 1
+
                 if (
                     pipeline_options.checkpoint_every > 0
                     and processed_since_checkpoint >= pipeline_options.checkpoint_every
                 ):
-                    loader.save_checkpoint(idx + 1, stats)
+                    loader.save_checkpoint(result.idx + 1, stats)
                     processed_since_checkpoint = 0
-                continue
 
-            stats.parsed_ok += 1
-            _prototype_pretty("Original tree:", start_cst)
-
-            # Clone before mutation so we keep the clean original for comparison
-            mut_cst = start_cst.clone()
-            engine.apply_mutations(mut_cst)
-
-            _prototype_pretty("\nMutated code:", mut_cst)
-
-            cached_original_cst = row.get("original_cst")
-            if cached_original_cst:
-                orig_cst = Node.from_json(cached_original_cst)
-            else:
-                orig_cst = start_cst
-
-            # Write manifest for this snippet
-            outputs.write_manifest(idx, snippet_id, engine.manifest.to_dict())
-
-            # Write original/mutated code pair
-            original_code = start_cst.to_code()
-            mutated_code = mut_cst.to_code()
-
-            # Keep all other metadata fields from the original row, except code/language which we handle separately
-            metadata = dict(row)
-            metadata.pop("code", None)
-            metadata.pop("language", None)
-            is_mutated = engine.manifest.is_empty() is False
-            outputs.write_dataset_row(
-                idx,
-                snippet_id,
-                original_code,
-                mutated_code,
-                language,
-                has_mutation_applied=not engine.manifest.is_empty(),
-                metadata=metadata,
-                original_cst=orig_cst,
-            )
+            if processed_since_checkpoint > 0:
+                loader.save_checkpoint(index + 1, stats)
 
-            # Verify semantic preservation and append to summary log
-            verified = verifier.verify(orig_cst, mut_cst, engine.manifest)
-            if verified:
-                stats.verified_ok += 1
-            else:
-                stats.verified_fail += 1
-
-            summary_logger.write_summary(
-                snippet_id=snippet_id,
-                verified=verified,
-                errors=verifier.errors,
+            summary_logger.write_summary_totals(
+                parsed_ok=stats.parsed_ok,
+                parse_skipped=stats.parse_skipped,
+                verified_ok=stats.verified_ok,
+                verified_fail=stats.verified_fail,
                 writer=outputs.summary_writer,
             )
 
-            _prototype_log(f'\nRow {idx}: {"PASS" if verified else "FAIL"}')
-            processed_since_checkpoint += 1
-
-            if (
-                pipeline_options.checkpoint_every > 0
-                and processed_since_checkpoint >= pipeline_options.checkpoint_every
-            ):
-                loader.save_checkpoint(idx + 1, stats)
-                processed_since_checkpoint = 0
-
-        if processed_since_checkpoint > 0:
-            loader.save_checkpoint(index + 1, stats)
-
-        summary_logger.write_summary_totals(
-            parsed_ok=stats.parsed_ok,
-            parse_skipped=stats.parse_skipped,
-            verified_ok=stats.verified_ok,
-            verified_fail=stats.verified_fail,
-            writer=outputs.summary_writer,
-        )
-
-        manifest_path, dataset_path, summary_path = outputs.output_paths_summary()
+            manifest_path, dataset_path, summary_path = outputs.output_paths_summary()
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     _prototype_log(f"\nManifest written to:        {manifest_path}")
     _prototype_log(f"Augmented dataset written to: {dataset_path}")
@@ -475,12 +591,23 @@ def main():
         default=None,
         help="Shard manifest/dataset outputs every N rows (0 disables sharding).",
     )
+    argparser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for parse/mutate/verify (default: 1, serial)",
+    )
     argparser.add_argument(
         "--compress-output",
         action="store_true",
         default=None,
         help="Compress output files using gzip.",
     )
+    argparser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable per-row debug output (parsed trees, verdicts, paths).",
+    )
     argparser.add_argument(
         "--rule-param",
         action="append",
@@ -502,6 +629,11 @@ def main():
     )
     args = argparser.parse_args()
 
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(message)s",
+    )
+
     config = load_config(args.config)
 
     rules = resolve_enabled_rules(config, args.rules)
@@ -533,6 +665,7 @@ def main():
         resume=_coalesce(args.resume, "resume", False),
         max_rows_per_shard=_coalesce(args.max_rows_per_shard, "max_rows_per_shard", 0),
         compress_output=_coalesce(args.compress_output, "compress_output", False),
+        workers=_coalesce(args.workers, "workers", 1),
     )
 
     # Start with config-based params
@@ -15,9 +15,13 @@ Checkpoints are managed per loader instance, supporting resumable processing.
 
 import os
 import json
-from typing import Iterator, Optional, Any
+from typing import TYPE_CHECKING, Iterator, Optional, Any
 from abc import ABC, abstractmethod
-import pyarrow.parquet as pq
+
+# pyarrow is imported lazily inside the methods that read parquet, so CLI
+# startup paths that never touch a dataset (e.g. --help) skip its import cost.
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
 
 
 def DataLoader(filepath: str, checkpoint_path: str | None = None):
@@ -64,7 +68,9 @@ class AbstractDataLoader(ABC):
 
     @property
     def num_rows(self) -> int:
-        parquet_file = pq.ParquetFile(self.filepath)
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(self.filepath, memory_map=True)
         return parquet_file.metadata.num_rows
 
     @abstractmethod
@@ -112,9 +118,27 @@ class ParquetDataLoader(AbstractDataLoader):
     """
     Data loader for reading code snippets from a Parquet file using pyarrow.
 
-    Implements iter_snippets() for efficient batch streaming.
+    Implements iter_snippets() for efficient batch streaming. A single
+    memory-mapped ParquetFile handle is opened lazily and shared between
+    num_rows and iter_snippets so file metadata is parsed only once.
     """
 
+    def __init__(self, filepath: str, checkpoint_path: Optional[str] = None):
+        super().__init__(filepath, checkpoint_path=checkpoint_path)
+        self._parquet_file: Optional[pq.ParquetFile] = None
+
+    def _open(self) -> "pq.ParquetFile":
+        """Open (once) and cache the memory-mapped parquet handle."""
+        if self._parquet_file is None:
+            import pyarrow.parquet as pq
+
+            self._parquet_file = pq.ParquetFile(self.filepath, memory_map=True)
+        return self._parquet_file
+
+    @property
+    def num_rows(self) -> int:
+        return self._open().metadata.num_rows
+
     def iter_snippets(self, batch_size: int, start_index: int) -> Iterator[tuple[int, dict]]:
         """
         Stream full rows from parquet, preserving all metadata.
@@ -127,14 +151,15 @@ class ParquetDataLoader(AbstractDataLoader):
             Iterator[tuple[int, dict]]: Yields (global_index, row_dict).
         """
 
-        parquet_file = pq.ParquetFile(self.filepath)
+        parquet_file = self._open()
         global_index = 0
 
         for batch in parquet_file.iter_batches(batch_size=batch_size):
-            df = batch.to_pandas()
-
-            for _, row in df.iterrows():
+            # to_pylist converts Arrow columns straight to row dicts of
+            # native Python values, skipping the pandas block-manager
+            # round-trip entirely.
+            for row in batch.to_pylist():
                 if global_index >= start_index:
-                    yield global_index, row.to_dict()
+                    yield global_index, row
 
                 global_index += 1
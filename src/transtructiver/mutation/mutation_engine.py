@@ -43,6 +43,10 @@ class MutationEngine:
         self.rules: List[MutationRule] = rules
         self.manifest = MutationManifest()
         self.context = MutationContext()
+        # The rule list is fixed for the engine's lifetime, so the
+        # dependency-ordered sequence is computed once and reused for
+        # every snippet instead of re-running the topological sort.
+        self._ordered_rules: List[MutationRule] = self._order_rules()
 
     def apply_mutations(self, cst: Node) -> MutationManifest:
         """
@@ -62,9 +66,7 @@ class MutationEngine:
         manifest = MutationManifest()
         self.context.reset()
 
-        ordered_rules = self._order_rules()
-
-        for rule in ordered_rules:
+        for rule in self._ordered_rules:
             local_changes = rule.apply(cst, self.context)
             self._merge_to_manifest(manifest, local_changes, rule.name)
 
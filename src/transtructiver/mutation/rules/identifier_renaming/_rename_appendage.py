@@ -23,6 +23,15 @@ _TYPE_SUFFIXES = {
     "boolean": "flag",
 }
 
+# Short type spellings normalized to the canonical keys of _TYPE_SUFFIXES.
+_TYPE_ALIASES = {
+    "str": "string",
+    "int": "integer",
+    "bool": "boolean",
+    "dict": "map",
+    "array": "list",
+}
+
 # Semantic-only fallback when no concrete type hint can be inferred.
 _SEMANTIC_FALLBACK_SUFFIXES = {
     "function_name": "func",
@@ -149,15 +158,7 @@ def _to_canonical_type(raw: str | None) -> str | None:
     if not token:
         return None
 
-    aliases = {
-        "str": "string",
-        "int": "integer",
-        "bool": "boolean",
-        "dict": "map",
-        "array": "list",
-    }
-
-    token = aliases.get(token, token)
+    token = _TYPE_ALIASES.get(token, token)
 
     if token in _TYPE_SUFFIXES:
         return token
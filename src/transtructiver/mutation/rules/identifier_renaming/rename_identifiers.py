@@ -9,6 +9,7 @@ MutationRecord entries for each rename action.
 
 import random
 import string
+import sys
 
 from ....node import Node
 from ...mutation_context import MutationContext
@@ -17,6 +18,18 @@ from ....utils.scope_manager import ScopeManager
 from ._name_generator import NameGenerator
 
 
+# Exact identifier type spellings seen across the supported grammars. Node
+# types are interned, so the frozenset membership test resolves by identity
+# hash in O(1); the substring fallback still catches grammar-specific
+# variants such as shorthand_property_identifier.
+_IDENT_TYPES = frozenset(map(sys.intern, ("identifier", "type_identifier", "field_identifier")))
+
+
+def _is_identifier_type(node_type: str) -> bool:
+    """Return whether a node type denotes an identifier token."""
+    return node_type in _IDENT_TYPES or "identifier" in node_type
+
+
 class RenameIdentifiersRule(MutationRule):
     """Rename eligible identifier nodes using a generated naming scheme.
 
@@ -106,7 +119,7 @@ class RenameIdentifiersRule(MutationRule):
     def _is_renamable_identifier(self, node: Node) -> bool:
         """Return whether the identifier is eligible for renaming."""
         return (
-            "identifier" in node.type
+            _is_identifier_type(node.type)
             and not bool(node.builtin)
             and bool(node.text)
             and node.semantic_label in self.allowed_labels
@@ -242,22 +255,28 @@ class RenameIdentifiersRule(MutationRule):
         records: list[MutationRecord] = []
         stack: list[tuple[Node, bool]] = [(root, False)]
 
+        # Hoist per-node lookups out of the hot loop; the walk visits every
+        # CST node and bound-method/attribute resolution adds up.
+        stack_pop = stack.pop
+        stack_append = stack.append
+        scope = self._scope
+
         while stack:
-            node, is_exit = stack.pop()
+            node, is_exit = stack_pop()
 
             if is_exit:
                 # Exit markers let a single iterative walk mirror recursive scope unwinding.
-                self._scope.exit_scope()
+                scope.exit_scope()
                 continue
 
-            if self._is_scope_node(node):
-                self._scope.enter_scope()
-                stack.append((node, True))
+            if node.semantic_label in self._SCOPE_LABELS:
+                scope.enter_scope()
+                stack_append((node, True))
 
             # Skip renaming for builtins
             if node.semantic_label == "builtin_name":
                 for child in reversed(node.children):
-                    stack.append((child, False))
+                    stack_append((child, False))
                 continue
 
             # If a binding is already known for this identifier in the current
@@ -265,21 +284,21 @@ class RenameIdentifiersRule(MutationRule):
             # This keeps declaration/reference renames consistent even when
             # a reference node was not annotated as variable_name/parameter_name.
             if (
-                "identifier" in node.type
+                _is_identifier_type(node.type)
                 and node.text
-                and not self._is_declaration_identifier(node)
+                and node.field not in self._DECLARATION_FIELDS
             ):
-                existing = self._scope.resolve(node.text)
+                existing = scope.resolve(node.text)
                 if existing is not None and existing != node.text:
                     original_name = node.text
                     records.append(self.record_rename(node, original_name, existing))
                     for child in reversed(node.children):
-                        stack.append((child, False))
+                        stack_append((child, False))
                     continue
 
             if not self._is_renamable_identifier(node) or not node.text:
                 for child in reversed(node.children):
-                    stack.append((child, False))
+                    stack_append((child, False))
                 continue
 
             # Rename after scope setup so declarations and references resolve consistently.
@@ -288,7 +307,7 @@ class RenameIdentifiersRule(MutationRule):
             records.append(self.record_rename(node, original_name, new_name))
 
             for child in reversed(node.children):
-                stack.append((child, False))
+                stack_append((child, False))
 
         self._scope.reset()
         return records
@@ -6,6 +6,7 @@ to represent hierarchical code structures.
 """
 
 import json
+import sys
 from typing import Any, Iterator, List, Optional
 
 
@@ -16,8 +17,27 @@ class Node:
     A Node is a fundamental building block for representing program structure as a tree.
     Each node has a type (e.g., "identifier", "binary_expression"), optional child nodes,
     and optional text content (for leaf nodes like tokens).
+
+    The attribute set is fixed via ``__slots__``: large datasets materialize
+    millions of nodes, and dropping the per-instance ``__dict__`` roughly
+    halves the per-node footprint while speeding up attribute access.
     """
 
+    __slots__ = (
+        "start_point",
+        "end_point",
+        "type",
+        "text",
+        "children",
+        "parent",
+        "semantic_label",
+        "context_type",
+        "field",
+        "language",
+        "builtin",
+        "is_named",
+    )
+
     def __init__(
         self,
         start_point: tuple[int, int],
@@ -39,9 +59,15 @@ class Node:
         """
         self.start_point = start_point
         self.end_point = end_point
-        self.type = type
+        # Node types draw from a small grammar vocabulary; interning them
+        # dedupes the strings and lets equality checks short-circuit on
+        # identity in the traversal/mutation hot paths.
+        self.type = sys.intern(type) if isinstance(type, str) else type
         self.text = text
-        self.children = children or []
+        # Adopt the caller's list when one is given (even empty) instead of
+        # allocating a replacement; leaves dominate parsed trees, so the
+        # converter's children=[] would otherwise double the list churn.
+        self.children = children if children is not None else []
         # Links populated during adaptation and annotation for tree navigation.
         self.parent: Optional[Node] = None
         self.semantic_label: Optional[str] = None
@@ -82,9 +108,20 @@ class Node:
         Yields:
             Node: Each node in the tree in preorder sequence.
         """
-        yield self
-        for child in self.children:
-            yield from child.traverse()
+        # Explicit stack instead of recursion: deep CSTs (e.g. long binary
+        # expression chains) would otherwise risk hitting the interpreter
+        # recursion limit, and each visit avoids a generator frame per level.
+        # The stack methods are bound once so the hot loop runs on local
+        # loads, and leaves (the majority of nodes) skip the extend call.
+        stack = [self]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            children = node.children
+            if children:
+                extend(reversed(children))
 
     def traverse_up(self) -> Iterator[Node]:
         """
@@ -99,15 +136,14 @@ class Node:
             yield curr
             curr = curr.parent
 
-    def clone(self, parent: Optional[Node] = None) -> Node:
-        """
-        Creates a deep copy of this node and its entire subtree.
+    def _copy_without_children(self, parent: Optional[Node]) -> Node:
+        """Create a copy of this node's attributes with an empty child list.
 
         Args:
-            parent (Node, optional): Parent of the cloned node.
+            parent (Node, optional): Parent to attach the copy to.
 
         Returns:
-            Node: Root of the cloned subtree.
+            Node: A childless copy of this node.
         """
         new_node = Node(
             start_point=self.start_point,
@@ -125,10 +161,72 @@ class Node:
         new_node.is_named = self.is_named
         new_node.parent = parent
 
-        new_node.children = [child.clone(new_node) for child in self.children]
-
         return new_node
 
+    def clone(self, parent: Optional[Node] = None) -> Node:
+        """
+        Creates a deep copy of this node and its entire subtree.
+
+        The copy is built with an explicit stack of (original, copy) pairs
+        rather than recursion, so arbitrarily deep trees clone without
+        growing the call stack.
+
+        Args:
+            parent (Node, optional): Parent of the cloned node.
+
+        Returns:
+            Node: Root of the cloned subtree.
+        """
+        new_root = self._copy_without_children(parent)
+        stack = [(self, new_root)]
+
+        while stack:
+            original, copied = stack.pop()
+            for child in original.children:
+                child_copy = child._copy_without_children(copied)
+                copied.children.append(child_copy)
+                stack.append((child, child_copy))
+
+        return new_root
+
+    def flatten(
+        self,
+    ) -> tuple[
+        list[str],
+        list[Optional[str]],
+        list[tuple[int, int]],
+        list[tuple[int, int]],
+        list[int],
+    ]:
+        """Flatten the subtree into parallel preorder arrays.
+
+        Returns one list per compared attribute (types, texts, start points,
+        end points, child counts), all indexed by preorder position. Two
+        trees are structurally identical exactly when their flattened arrays
+        are equal, so bulk comparisons run as C-level list equality instead
+        of a pointer-chasing synchronized walk.
+
+        Returns:
+            tuple: (types, texts, start_points, end_points, child_counts).
+        """
+        types: list[str] = []
+        texts: list[Optional[str]] = []
+        starts: list[tuple[int, int]] = []
+        ends: list[tuple[int, int]] = []
+        child_counts: list[int] = []
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            types.append(node.type)
+            texts.append(node.text)
+            starts.append(node.start_point)
+            ends.append(node.end_point)
+            child_counts.append(len(node.children))
+            stack.extend(reversed(node.children))
+
+        return types, texts, starts, ends, child_counts
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize this node and its subtree to plain Python data.
 
@@ -214,30 +312,40 @@ class Node:
         """
         Print a human-readable tree representation of this node and its children.
 
-        This method recursively prints the tree structure with proper indentation.
-        Each level of nesting is indented by 2 spaces.
+        The tree is walked with an explicit stack in preorder and each level
+        of nesting is indented by 2 spaces. All lines are buffered and
+        emitted with a single print call, so large trees do not pay one
+        stdout write (and lock acquisition) per node.
 
         Example:
             >>> node = Node("function_definition", text="add")
             >>> node.pretty()
             function_definition: add
         """
-        prefix = "  " * indent
-        if (self.type != "newline") and (self.type != "whitespace"):
-            if self.field:
-                line = f"{prefix}('{self.field}') {self.type}"
-            else:
-                line = f"{prefix}{self.type}"
+        lines: list[str] = []
+        stack: list[tuple[Node, int]] = [(self, indent)]
+
+        while stack:
+            node, depth = stack.pop()
+            if (node.type != "newline") and (node.type != "whitespace"):
+                prefix = "  " * depth
+                if node.field:
+                    line = f"{prefix}('{node.field}') {node.type}"
+                else:
+                    line = f"{prefix}{node.type}"
+
+                if node.text:
+                    line += f": {node.text}"
 
-            if self.text:
-                line += f": {self.text}"
+                if node.semantic_label:
+                    line += f"  [{node.semantic_label}]"
+                if node.context_type:
+                    line += f"<{node.context_type}>"
 
-            if self.semantic_label:
-                line += f"  [{self.semantic_label}]"
-            if self.context_type:
-                line += f"<{self.context_type}>"
+                lines.append(line)
 
-            print(line)
+            for child in reversed(node.children):
+                stack.append((child, depth + 1))
 
-        for child in self.children:
-            child.pretty(indent + 1)
+        if lines:
+            print("\n".join(lines))
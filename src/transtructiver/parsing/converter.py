@@ -187,6 +187,50 @@ def _space_nodes(
     return nodes
 
 
+def _convert_single(
+    ts_node: TSNode, source_bytes: bytes, source_text: str | None, field: str | None
+) -> Node:
+    """Build a childless internal Node for a single Tree-sitter node.
+
+    Leaf and error nodes carry their source text; composite nodes start with
+    an empty children list that :func:`convert_node` fills in.
+
+    Args:
+        ts_node (TSNode): The Tree-sitter node to convert.
+        source_bytes (bytes): The source code as bytes.
+        source_text (str, optional): Decoded source when byte offsets equal
+            character offsets (pure-ASCII input), enabling cheap str slicing.
+        field (str, optional): The field name of this node in its parent.
+
+    Returns:
+        Node: The converted node without children attached.
+    """
+    if ts_node.child_count == 0 or ts_node.is_error:
+        if source_text is not None:
+            text = source_text[ts_node.start_byte : ts_node.end_byte]
+        else:
+            text = source_bytes[ts_node.start_byte : ts_node.end_byte].decode("utf8")
+    else:
+        text = None
+
+    node = Node(
+        start_point=(ts_node.start_point.row, ts_node.start_point.column),
+        end_point=(ts_node.end_point.row, ts_node.end_point.column),
+        type=ts_node.type,
+        text=text,
+        children=[],
+    )
+
+    # Store the field name on this node
+    node.field = field
+
+    # Store True if name correspond to grammar rule
+    # False if name correspond to string literal
+    node.is_named = ts_node.is_named
+
+    return node
+
+
 def convert_node(
     ts_node: TSNode,
     source_bytes: bytes,
@@ -196,9 +240,11 @@ def convert_node(
 ) -> Node:
     """Convert a Tree-sitter node to the project's Node structure.
 
-    Recursively converts a Tree-sitter parse tree into the internal Node
-    representation. Uses Point-based spans to identify gaps between sibling
-    nodes and creates separate whitespace/newline nodes for those gaps.
+    Converts a Tree-sitter parse tree into the internal Node representation
+    with an explicit worklist instead of recursion, so deeply nested sources
+    cannot exhaust the interpreter stack. Uses Point-based spans to identify
+    gaps between sibling nodes and creates separate whitespace/newline nodes
+    for those gaps.
 
     Args:
         ts_node (TSNode): The Tree-sitter node to convert.
@@ -206,7 +252,7 @@ def convert_node(
         field (str, optional): The field name of this node in its parent.
         ws_map (dict, optional): Whitespace map (unused, kept for compatibility).
         line_starts (list[int], optional): Precomputed line start byte offsets.
-            Computed on first call, then passed recursively for efficiency.
+            Computed once up front when not supplied.
 
     Returns:
         Node: The converted node with type, text (for leaves), children,
@@ -218,54 +264,55 @@ def convert_node(
 
     code_len = len(source_bytes)
 
-    if ts_node.child_count == 0 or ts_node.is_error:
-        text = source_bytes[ts_node.start_byte : ts_node.end_byte].decode("utf8")
-        children = []
-    else:
-        text = None
-        children = []
+    # Pure-ASCII sources have byte offsets equal to character offsets, so
+    # decoding once lets every leaf take a str slice instead of allocating
+    # an intermediate bytes copy plus a decode per token.
+    source_text = source_bytes.decode("utf8") if source_bytes.isascii() else None
+
+    root = _convert_single(ts_node, source_bytes, source_text, field)
+    stack: list[tuple[TSNode, Node]] = [(ts_node, root)]
+
+    while stack:
+        ts_parent, parent = stack.pop()
+
+        if ts_parent.child_count == 0 or ts_parent.is_error:
+            continue
+
         # For root-level nodes (module), start from (0, 0) to capture leading whitespace
         # For other nodes, start from the node's own start_point
-        if not ts_node.parent:
+        if not ts_parent.parent:
             previous_end_point = Point(0, 0)
         else:
-            previous_end_point = ts_node.start_point
-
-        for i, child in enumerate(ts_node.children):
-            child_field = ts_node.field_name_for_child(i)
-
-            # Convert Point span to bytes and create whitespace nodes if gap exists
-            ws_nodes = _create_gap_nodes(
-                previous_end_point, child.start_point, source_bytes, line_starts, code_len
-            )
-            children.extend(ws_nodes)
-
-            # Recursively convert child node with its field name, passing line_starts
-            children.append(convert_node(child, source_bytes, child_field, ws_map, line_starts))
+            previous_end_point = ts_parent.start_point
+
+        # Bind per-child lookups once; the tree-sitter accessors cross into
+        # the C binding on every call.
+        field_name_for_child = ts_parent.field_name_for_child
+        children = parent.children
+
+        for i, child in enumerate(ts_parent.children):
+            # Convert Point span to bytes and create whitespace nodes, but
+            # only when the siblings are not directly adjacent.
+            child_start_point = child.start_point
+            if previous_end_point != child_start_point:
+                for gap_node in _create_gap_nodes(
+                    previous_end_point, child_start_point, source_bytes, line_starts, code_len
+                ):
+                    gap_node.parent = parent
+                    children.append(gap_node)
+
+            converted = _convert_single(child, source_bytes, source_text, field_name_for_child(i))
+            converted.parent = parent
+            children.append(converted)
+            stack.append((child, converted))
             previous_end_point = child.end_point
 
         # Create whitespace nodes for trailing gap
-        ws_nodes = _create_gap_nodes(
-            previous_end_point, ts_node.end_point, source_bytes, line_starts, code_len
-        )
-        children.extend(ws_nodes)
-
-    node = Node(
-        start_point=(ts_node.start_point.row, ts_node.start_point.column),
-        end_point=(ts_node.end_point.row, ts_node.end_point.column),
-        type=ts_node.type,
-        text=text,
-        children=children,
-    )
-
-    # Store the field name on this node
-    node.field = field
-
-    # Store True if name correspond to grammar rule
-    # False if name correspond to string literal
-    node.is_named = ts_node.is_named
-
-    for child in node.children:
-        child.parent = node
-
-    return node
+        if previous_end_point != ts_parent.end_point:
+            for gap_node in _create_gap_nodes(
+                previous_end_point, ts_parent.end_point, source_bytes, line_starts, code_len
+            ):
+                gap_node.parent = parent
+                children.append(gap_node)
+
+    return root
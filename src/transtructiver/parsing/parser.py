@@ -4,6 +4,9 @@ This module defines a Parser class that produces a CST using Tree-sitter
 and converts the resulting syntax tree into the project's Node structure.
 """
 
+import re
+from functools import lru_cache
+
 from tree_sitter import Node as TSNode
 from tree_sitter import Parser as TSParser
 
@@ -38,6 +41,51 @@ TRIVIAL_NODE_TYPES = [
     "comment",
 ]
 
+# The keyword lists above are scanned once per tree-sitter node during
+# should_discard. Compiling each category into a single alternation lets
+# the regex engine scan the node type in one pass instead of one Python
+# substring search per keyword, with identical matching semantics.
+_MEANINGFUL_RE = re.compile("|".join(map(re.escape, MEANINGFUL_NODE_TYPES)))
+_TRIVIAL_RE = re.compile("|".join(map(re.escape, TRIVIAL_NODE_TYPES)))
+_BODY_RE = re.compile("block|suite|compound")
+
+# Warm tree-sitter parsers keyed by language. Binding a grammar to a fresh
+# TSParser is the expensive part of parser setup, so all Parser instances
+# in a process share one grammar-bound TSParser per language.
+_TS_PARSERS: dict[str, TSParser] = {}
+
+
+@lru_cache(maxsize=None)
+def _classified_node_types(lang_key: str) -> tuple[frozenset[str], frozenset[str]]:
+    """Classify every node kind of a grammar against the keyword patterns.
+
+    A grammar only has a few hundred node kinds, so each one is matched
+    against the meaningful/trivial patterns once per language and the
+    results are frozen into exact-membership sets. Per-node classification
+    then becomes a single set lookup instead of a regex scan.
+
+    Args:
+        lang_key (str): Lowercase language name resolvable by get_language.
+
+    Returns:
+        tuple[frozenset[str], frozenset[str]]: (meaningful, trivial) node
+            kind sets for the grammar.
+    """
+    language = get_language(lang_key)
+    meaningful: set[str] = set()
+    trivial: set[str] = set()
+
+    for kind_id in range(language.node_kind_count):
+        kind = language.node_kind_for_id(kind_id)
+        if kind is None:
+            continue
+        if _MEANINGFUL_RE.search(kind):
+            meaningful.add(kind)
+        if _TRIVIAL_RE.search(kind):
+            trivial.add(kind)
+
+    return frozenset(meaningful), frozenset(trivial)
+
 
 class Parser:
     """Parser that produces a Concrete Syntax Tree (CST).
@@ -58,6 +106,13 @@ class Parser:
         grammars during parse() calls.
         """
         self.ts_parser = TSParser()
+        # Last language bound to ts_parser; parse() swaps in the shared
+        # warm parser for a language only when it changes.
+        self._language_name: str | None = None
+        # Exact grammar node-kind sets; populated once a language is bound.
+        # While unset the classification methods fall back to pattern scans.
+        self._meaningful_types: frozenset[str] | None = None
+        self._trivial_types: frozenset[str] | None = None
 
     # ------------------------------------------------------------
     # Meaningful / trivial checks
@@ -76,7 +131,9 @@ class Parser:
         Returns:
             bool: True if the node type matches any trivial pattern.
         """
-        return any(t in node.type for t in TRIVIAL_NODE_TYPES)
+        if self._trivial_types is not None:
+            return node.type in self._trivial_types
+        return _TRIVIAL_RE.search(node.type) is not None
 
     def is_meaningful(self, node: TSNode) -> bool:
         """Check if a node represents meaningful code.
@@ -91,7 +148,9 @@ class Parser:
         Returns:
             bool: True if the node type matches any meaningful pattern.
         """
-        return any(kw in node.type for kw in MEANINGFUL_NODE_TYPES)
+        if self._meaningful_types is not None:
+            return node.type in self._meaningful_types
+        return _MEANINGFUL_RE.search(node.type) is not None
 
     def has_meaningful_structure(self, node: TSNode) -> bool:
         """Check if a node contains meaningful structure in its body.
@@ -108,11 +167,14 @@ class Parser:
             bool: True if the node contains at least one meaningful,
                 non-trivial child in its body or direct children.
         """
-        body = None
-        for child in node.children:
-            if any(kw in child.type for kw in ["block", "suite", "compound"]):
-                body = child
-                break
+        # Grammars expose the body through an O(1) field accessor; only
+        # fall back to scanning children when no "body" field exists.
+        body = node.child_by_field_name("body")
+        if body is None:
+            for child in node.children:
+                if _BODY_RE.search(child.type) is not None:
+                    body = child
+                    break
 
         target = body if body else node
 
@@ -149,10 +211,20 @@ class Parser:
         if root.child_count < 1:
             return "no_children"
 
-        if all(child.is_error for child in root.children):
+        # Materializing root.children crosses the tree-sitter FFI per child,
+        # so the error and meaningfulness checks share one pass over them.
+        all_errors = True
+        found_meaningful = False
+        for child in root.children:
+            if not child.is_error:
+                all_errors = False
+            if not found_meaningful and self.has_meaningful_structure(child):
+                found_meaningful = True
+
+        if all_errors:
             return "root_error_only"
 
-        if any(self.has_meaningful_structure(child) for child in root.children):
+        if found_meaningful:
             return None
         elif self.has_meaningful_structure(root) and root.child_count > 2:
             return None
@@ -163,7 +235,7 @@ class Parser:
     # ------------------------------------------------------------
 
     def parse(
-        self, code: str, language: str, annotate: bool = True
+        self, code: str | bytes, language: str, annotate: bool = True
     ) -> tuple[Node, None] | tuple[None, str]:
         """Parse source code into a Concrete Syntax Tree (CST).
 
@@ -172,7 +244,9 @@ class Parser:
         structure.
 
         Args:
-            code (str): The source code to parse.
+            code (str | bytes): The source code to parse, either as text or
+                already UTF-8 encoded; pre-encoded callers skip the
+                per-parse encode entirely.
             language (str): The programming language (e.g., "python", "java").
 
         Returns:
@@ -188,19 +262,37 @@ class Parser:
         Raises:
             ValueError: If the specified language is not supported.
         """
-        try:
-            ts_language = get_language(language)
-        except ValueError as e:
-            raise ValueError(f"Unsupported language: {language}") from e
-
-        try:
-            code.encode("utf-8")
-        except UnicodeEncodeError:
-            return None, "invalid_utf8"
-
-        self.ts_parser.language = ts_language
-
-        source_bytes = bytes(code, "utf8")
+        if language != self._language_name:
+            lang_key = language.lower()
+            ts_parser = _TS_PARSERS.get(lang_key)
+            if ts_parser is None:
+                try:
+                    ts_language = get_language(language)
+                except ValueError as e:
+                    raise ValueError(f"Unsupported language: {language}") from e
+
+                ts_parser = TSParser()
+                ts_parser.language = ts_language
+                _TS_PARSERS[lang_key] = ts_parser
+
+            self.ts_parser = ts_parser
+            self._language_name = language
+            self._meaningful_types, self._trivial_types = _classified_node_types(lang_key)
+
+        # Provably-empty input never survives should_discard, so skip the
+        # encode and the C-side parse outright.
+        if not code or not code.strip():
+            return None, "empty_source"
+
+        # Encode once; the result doubles as the validity probe since only
+        # surrogate code points can make a str fail UTF-8 encoding.
+        if isinstance(code, bytes):
+            source_bytes = code
+        else:
+            try:
+                source_bytes = code.encode("utf-8")
+            except UnicodeEncodeError:
+                return None, "invalid_utf8"
         source_tree = self.ts_parser.parse(source_bytes)
         root_node = source_tree.root_node
         # Discard logic
@@ -56,7 +56,9 @@ def open_text_append(path: str, compress_output: bool):
     """
     if compress_output:
         return gzip.open(path, "at", encoding="utf-8", newline="")
-    return open(path, "a", encoding="utf-8", newline="")
+    # A 64 KiB buffer amortizes the write(2) syscall over many small
+    # summary/manifest rows instead of flushing every ~8 KiB.
+    return open(path, "a", encoding="utf-8", newline="", buffering=1 << 16)
 
 
 class OutputManager:
@@ -220,7 +222,7 @@ class OutputManager:
         language: str,
         has_mutation_applied: bool = False,
         metadata: dict | None = None,
-        original_cst: Node | None = None,
+        original_cst: Node | str | None = None,
     ) -> None:
         """Append one original/mutated code pair row to parquet output.
 
@@ -232,15 +234,19 @@ class OutputManager:
             language (str): Programming language of the snippet.
             has_mutation_applied (bool): Whether any mutation was applied.
             metadata (dict | None): Additional dataset metadata (e.g., char_count, lloc, label).
-            original_cst (Node | None): Original CST to cache for later tiers.
+            original_cst (Node | str | None): Original CST to cache for later
+                tiers, either as a Node or already JSON-serialized (as
+                produced by worker processes).
         """
+        if isinstance(original_cst, Node):
+            original_cst = original_cst.to_json()
 
         # Base row (core schema)
         row_dict = {
             "snippet_id": [snippet_id],
             "original_code": [original_code],
             "mutated_code": [mutated_code],
-            "original_cst": [original_cst.to_json() if original_cst else None],
+            "original_cst": [original_cst if original_cst else None],
             "language": [language],
             "has_mutation_applied": [has_mutation_applied],
         }
@@ -4,26 +4,48 @@ This module provides a centralized way to get the tree-sitter Language
 for different programming languages by string key.
 """
 
-import tree_sitter_python
-import tree_sitter_java
-import tree_sitter_cpp
+import importlib
+
+from functools import lru_cache
 
 from tree_sitter import Language
-from typing import Dict, Any
+from typing import Dict
 
 
-# Registry of supported languages and their corresponding modules/functions.
+# Registry of supported languages and their grammar packages. The packages
+# are imported lazily so that loading this module does not pull in every
+# grammar's C extension; each one is loaded on first use.
 # This can be expanded as more languages are added.
-_LANGUAGE_MAP: Dict[str, Any] = {
-    "python": tree_sitter_python.language(),
-    "java": tree_sitter_java.language(),
-    "cpp": tree_sitter_cpp.language(),
+_LANGUAGE_MODULES: Dict[str, str] = {
+    "python": "tree_sitter_python",
+    "java": "tree_sitter_java",
+    "cpp": "tree_sitter_cpp",
 }
 
 
+@lru_cache(maxsize=None)
+def _build_language(lang_key: str) -> Language:
+    """Construct (once per language) the tree_sitter.Language wrapper.
+
+    Raises:
+        ValueError: If the grammar package for the language is not installed.
+    """
+    try:
+        module = importlib.import_module(_LANGUAGE_MODULES[lang_key])
+    except ImportError as e:
+        raise ValueError(
+            f"Language '{lang_key}' is not supported or missing required package."
+        ) from e
+    return Language(module.language())
+
+
 def get_language(language_name: str) -> Language:
     """Retrieve the tree-sitter Language for the given string key.
 
+    Language wrappers are constructed once per language and cached, so
+    batch parsing thousands of same-language snippets resolves to the
+    same instance instead of rebuilding the wrapper on every parse.
+
     Args:
         language_name (str): The name of the language (e.g., "python").
 
@@ -34,11 +56,7 @@ def get_language(language_name: str) -> Language:
         ValueError: If the language is not supported or not installed.
     """
     lang_key = language_name.lower()
-    language = None
-    if lang_key in _LANGUAGE_MAP:
-        language: object = _LANGUAGE_MAP[lang_key]
-
-    if language:
-        return Language(language)
+    if lang_key in _LANGUAGE_MODULES:
+        return _build_language(lang_key)
 
     raise ValueError(f"Language '{language_name}' is not supported or missing required package.")
@@ -70,11 +70,19 @@ class SIVerifier:
                 the original; False if any unauthorized drift or structural
                 misalignment was detected.
         """
-        self.errors = []  # Reset error log
+        # Reset the error log in place; batch callers reuse one verifier
+        # across snippets, so the list object survives between calls.
+        self.errors.clear()
         self._halt = False  # Reset circuit breaker
 
         if manifest.has_structural_changes():
             ok = self._verify_synchronized(original_tree, mutated_tree, manifest)
+        elif manifest.is_empty() and original_tree.flatten() == mutated_tree.flatten():
+            # With no recorded mutations the trees must be exact mirrors, so
+            # comparing flat preorder arrays settles the audit with a few
+            # C-level list comparisons. On mismatch we fall through to the
+            # aligned walk below, which produces a precise error report.
+            ok = True
         else:
             ok = self._verify_aligned(original_tree, mutated_tree, manifest)
 
@@ -99,26 +107,35 @@ class SIVerifier:
 
     def _verify_aligned(self, orig: Node, mut: Node, manifest: MutationManifest) -> bool:
         """
-        Performs a high-speed, 1-to-1 recursive traversal of two trees.
+        Performs a high-speed, 1-to-1 preorder traversal of two trees.
+
+        The node pairs are walked with an explicit stack so deep trees do
+        not consume interpreter stack frames, and the walk halts on the
+        first discrepancy.
 
         Returns:
             bool: True if the branch is isomorphic/valid; False if any
                   discrepancy is found (halts further traversal).
         """
-        # Validate the current node pair
-        if not self._apply_node_strategy(orig, mut, manifest):
-            return False
+        stack = [(orig, mut)]
 
-        # Structural check: Circuit breaker for unexpected topological drift
-        if len(orig.children) != len(mut.children):
-            self._report(f"Structural discrepancy at {orig.start_point}: child count mismatch.")
-            return False
+        while stack:
+            o_node, m_node = stack.pop()
 
-        # Recurse: Check all children. If any child returns False, halt immediately
-        for o_child, m_child in zip(orig.children, mut.children):
-            if not self._verify_aligned(o_child, m_child, manifest):
+            # Validate the current node pair
+            if not self._apply_node_strategy(o_node, m_node, manifest):
                 return False
 
+            # Structural check: Circuit breaker for unexpected topological drift
+            if len(o_node.children) != len(m_node.children):
+                self._report(
+                    f"Structural discrepancy at {o_node.start_point}: child count mismatch."
+                )
+                return False
+
+            # Push pairs in reverse so children are validated in source order.
+            stack.extend(zip(reversed(o_node.children), reversed(m_node.children)))
+
         return True
 
     def _verify_synchronized(self, orig: Node, mut: Node, manifest: MutationManifest) -> bool:
@@ -16,18 +16,22 @@ import pytest
 from transtructiver.data_loading.data_loader import DataLoader
 
 
-@pytest.fixture
-def sample_parquet(tmp_path: Path) -> Tuple[Path, pd.DataFrame]:
+@pytest.fixture(scope="module")
+def sample_parquet(tmp_path_factory: pytest.TempPathFactory) -> Tuple[Path, pd.DataFrame]:
     """
     Create a temporary Parquet file with sample data.
 
+    The fixture is module-scoped so the file is written once for the whole
+    module; tests only read from it.
+
     Args:
-        tmp_path (Path): Built-in pytest fixture providing a temporary directory.
+        tmp_path_factory (pytest.TempPathFactory): Built-in pytest fixture
+            providing module-lifetime temporary directories.
 
     Returns:
         tuple: (file_path, original_dataframe)
     """
-    file_path = tmp_path / "test.parquet"
+    file_path = tmp_path_factory.mktemp("data") / "test.parquet"
 
     df = pd.DataFrame(
         {
@@ -174,6 +174,20 @@ variable_name = "\u3053\u3093\u306b\u3061\u306f"
         assert node is not None
         assert node.type == "module"
 
+    def test_convert_node_leaf_text_round_trips_ascii_and_non_ascii(self, parser_setup: TSParser):
+        """Leaf text must reproduce the source exactly on both decode paths.
+
+        ASCII sources take the decode-once str-slicing fast path while
+        non-ASCII sources slice bytes by offset; both must round-trip.
+        """
+        for code in ('greeting = "hello"\n', 'greeting = "こんにちは"\n'):
+            source_bytes = bytes(code, "utf8")
+            tree = parser_setup.parse(source_bytes)
+
+            node = convert_node(tree.root_node, source_bytes)
+
+            assert node.to_code() == code
+
     def test_convert_node_with_special_characters(self, parser_setup: TSParser):
         """Test converting nodes with special characters."""
         code = '''s = "!@#$%^&*()_+-=[]{}|;:,.<>?"'''
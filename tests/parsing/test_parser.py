@@ -31,9 +31,16 @@ def make_node(
         child_count=child_count,
         named_child_count=len(named_children),
         is_error=is_error,
+        child_by_field_name=lambda _name: None,
     )
 
 
+@pytest.fixture(scope="class")
+def parser():
+    """Create a parser instance shared within each test class."""
+    return Parser()
+
+
 class TestParserInitialization:
     """Test suite for Parser initialization."""
 
@@ -52,110 +59,51 @@ class TestParserInitialization:
 class TestParserTrivialNodeDetection:
     """Test suite for is_trivial method."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
-    def test_is_trivial_break_statement(self, parser):
-        """Test that break statements are identified as trivial."""
-        node = make_node("break_statement")
-        assert parser.is_trivial(node) is True
-
-    def test_is_trivial_continue_statement(self, parser):
-        """Test that continue statements are identified as trivial."""
-        node = make_node("continue_statement")
-        assert parser.is_trivial(node) is True
-
-    def test_is_trivial_empty_statement(self, parser):
-        """Test that empty statements are identified as trivial."""
-        node = make_node("empty_statement")
-        assert parser.is_trivial(node) is True
-
-    def test_is_trivial_non_trivial_statement(self, parser):
-        """Test that non-trivial statements are not identified as trivial."""
-        node = make_node("assignment")
-        assert parser.is_trivial(node) is False
-
-    def test_is_trivial_comment(self, parser):
-        """Test that comments are identified as trivial."""
-        node = make_node("comment")
-        assert parser.is_trivial(node) is True
-
-    def test_is_trivial_expression_statement(self, parser):
-        """Test that expression statements are not identified as trivial."""
-        node = make_node("expression_statement")
-        assert parser.is_trivial(node) is False
-
-    def test_is_trivial_case_sensitivity(self, parser):
-        """Test that type matching is case-sensitive."""
-        node = make_node("RETURN_STATEMENT")
-        # Should not match because of case difference
-        assert parser.is_trivial(node) is False
+    @pytest.mark.parametrize(
+        ("node_type", "expected"),
+        [
+            ("break_statement", True),
+            ("continue_statement", True),
+            ("empty_statement", True),
+            ("comment", True),
+            ("assignment", False),
+            ("expression_statement", False),
+            # Should not match because of case difference
+            ("RETURN_STATEMENT", False),
+        ],
+    )
+    def test_is_trivial(self, parser, node_type, expected):
+        """Test trivial-node classification across node types."""
+        node = make_node(node_type)
+        assert parser.is_trivial(node) is expected
 
 
 class TestParserMeaningfulNodeDetection:
     """Test suite for is_meaningful method."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
-    def test_is_meaningful_expression(self, parser):
-        """Test that expressions are identified as meaningful."""
-        node = make_node("binary_expression")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_statement(self, parser):
-        """Test that statements are identified as meaningful."""
-        node = make_node("expression_statement")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_definition(self, parser):
-        """Test that definitions are identified as meaningful."""
-        node = make_node("function_definition")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_declaration(self, parser):
-        """Test that declarations are identified as meaningful."""
-        node = make_node("variable_declaration")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_assignment(self, parser):
-        """Test that assignments are identified as meaningful."""
-        node = make_node("assignment_expression")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_block(self, parser):
-        """Test that blocks are identified as meaningful."""
-        node = make_node("block")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_suite(self, parser):
-        """Test that suites are identified as meaningful."""
-        node = make_node("suite")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_identifier(self, parser):
-        """Test that non-meaningful types are not identified as meaningful."""
-        node = make_node("identifier")
-        assert parser.is_meaningful(node) is True
-
-    def test_is_meaningful_operator_token(self, parser):
-        """Test that operators are not meaningful."""
-        node = make_node("+")
-        assert parser.is_meaningful(node) is False
+    @pytest.mark.parametrize(
+        ("node_type", "expected"),
+        [
+            ("binary_expression", True),
+            ("expression_statement", True),
+            ("function_definition", True),
+            ("variable_declaration", True),
+            ("assignment_expression", True),
+            ("block", True),
+            ("suite", True),
+            ("identifier", True),
+            ("+", False),
+        ],
+    )
+    def test_is_meaningful(self, parser, node_type, expected):
+        """Test meaningful-node classification across node types."""
+        node = make_node(node_type)
+        assert parser.is_meaningful(node) is expected
 
 
 class TestParserHasMeaningfulStructure:
     """Test suite for has_meaningful_structure method."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_has_meaningful_structure_with_assignment(self, parser):
         """Test function with assignment has meaningful structure."""
         # Create a mock function node with a body containing assignment
@@ -225,11 +173,6 @@ class TestParserHasMeaningfulStructure:
 class TestParserDiscardCriteria:
     """Test suite for should_discard method."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_discard_empty_source(self, parser):
         """Test that empty source code is marked for discard."""
         root = make_node("module", children=[])
@@ -269,13 +212,14 @@ class TestParserDiscardCriteria:
         reason = parser.should_discard(root, "return")
         assert reason == "no_meaningful_structure"
 
-    def test_discard_valid_code_returns_none(self, parser):
+    def test_discard_valid_code_returns_none(self, parser, monkeypatch):
         """Test that valid code returns None (no discard reason)."""
         meaningful_child = make_node("function_definition", is_error=False)
         root = make_node("module", children=[meaningful_child])
 
-        # Override has_meaningful_structure to return True
-        parser.has_meaningful_structure = lambda _node: True
+        # Override has_meaningful_structure to return True; monkeypatch
+        # undoes the override so the class-scoped parser stays pristine.
+        monkeypatch.setattr(parser, "has_meaningful_structure", lambda _node: True)
 
         reason = parser.should_discard(root, "x = 5")
         assert reason is None
@@ -293,11 +237,6 @@ class TestParserDiscardCriteria:
 class TestParserParseSuccessful:
     """Test suite for successful parsing scenarios."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_parse_valid_python_function(self, parser):
         """Test parsing a valid Python function."""
         code = """
@@ -407,11 +346,6 @@ public class Calculator {
 class TestParserParseFailing:
     """Test suite for parsing failure scenarios."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_parse_empty_source(self, parser):
         """Test parsing empty source code."""
         code = ""
@@ -458,11 +392,6 @@ class TestParserParseFailing:
 class TestParserLanguageSupport:
     """Test suite for language support."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_parse_python_language(self, parser):
         """Test Python language is supported."""
         code = "x = 42"
@@ -507,11 +436,6 @@ def test():
 class TestParserEdgeCases:
     """Test suite for edge cases and special scenarios."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_parse_unicode_string_literals(self, parser):
         """Test parsing code with Unicode string literals."""
         code = 'text = "\\u4f60\\u597d"'
@@ -605,11 +529,6 @@ squares = [x**2 for x in range(10) if x % 2 == 0]
 class TestParserConsistency:
     """Test suite for parser consistency and determinism."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create a parser instance for testing."""
-        return Parser()
-
     def test_multiple_parse_same_code_consistent(self, parser):
         """Test that parsing same code multiple times gives consistent results."""
         code = """
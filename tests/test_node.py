@@ -12,6 +12,8 @@ Tests cover both typical usage and boundary conditions to ensure
 the Node class reliably supports tree construction and manipulation.
 """
 
+import sys
+
 import pytest
 from src.transtructiver.node import Node
 
@@ -211,3 +213,67 @@ def test_traverse_single_node():
 
     assert len(result) == 1
     assert result[0].type == "leaf"
+
+
+def test_node_type_strings_are_interned():
+    """
+    Ensure equal node types share one string object. Tree-sitter returns a
+    fresh str per FFI call, so interning keeps type comparisons on the
+    identity fast path across millions of nodes.
+    """
+    type_a = "".join(["ident", "ifier"])  # defeat compile-time interning
+    node_a = Node((0, 0), (0, 1), type_a)
+    node_b = Node((0, 0), (0, 1), "identifier")
+
+    assert node_a.type is node_b.type
+
+
+def test_node_uses_slots():
+    """
+    Ensure Node instances carry no per-instance __dict__; large datasets
+    allocate millions of nodes and rely on the __slots__ layout for memory.
+    """
+    node = Node((0, 0), (0, 1), "identifier", text="x")
+
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.unknown_attribute = True
+
+
+def test_traverse_deep_tree_no_recursion_error():
+    """
+    Ensure traversal handles trees deeper than the interpreter recursion
+    limit, as produced by tree-sitter for long expression chains.
+    """
+    point = (0, 0)
+    depth = sys.getrecursionlimit() + 100
+
+    root = Node(point, point, "root")
+    current = root
+    for _ in range(depth):
+        child = Node(point, point, "nested")
+        current.add_child(child)
+        current = child
+
+    assert sum(1 for _ in root.traverse()) == depth + 1
+
+
+def test_clone_deep_tree_no_recursion_error():
+    """
+    Ensure cloning handles trees deeper than the interpreter recursion
+    limit without exhausting the call stack.
+    """
+    point = (0, 0)
+    depth = sys.getrecursionlimit() + 100
+
+    root = Node(point, point, "root")
+    current = root
+    for _ in range(depth):
+        child = Node(point, point, "nested")
+        current.add_child(child)
+        current = child
+
+    cloned = root.clone()
+
+    assert sum(1 for _ in cloned.traverse()) == depth + 1
+    assert cloned is not root